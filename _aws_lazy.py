@@ -0,0 +1,12 @@
+#!/usr/bin/env python3
+"""
+Lazy attribute proxy for the aws_client module.
+Scripts can import this module for free and only trigger the aws_client
+(and transitively boto3) import on first attribute use; sys.modules caches
+the resolved module, so that work happens exactly once per process.
+"""
+
+import importlib
+
+def __getattr__(name):
+    return getattr(importlib.import_module('aws_client'), name)
@@ -1,71 +1,101 @@
 """
 AWS client helper for secure credential management.
 This module provides a secure way to create AWS clients using environment variables.
+
+boto3/botocore are imported lazily on first client use, so importing this
+module (e.g. from the setup scripts) stays cheap.
 """
 
-import boto3
-from botocore.exceptions import ClientError, NoCredentialsError
+import functools
+import threading
+
 from config import Config
 import logging
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
+# Library-style logging: don't touch the root logger, stay silent unless the
+# application configures handlers.
 logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+@functools.lru_cache(maxsize=1)
+def _get_boto_config():
+    """Build the shared botocore Config on first use.
+
+    A larger connection pool and TCP keepalive let repeated API calls reuse
+    TCP/TLS connections instead of re-handshaking.
+    """
+    from botocore.config import Config as BotoConfig
+    return BotoConfig(
+        max_pool_connections=50,
+        tcp_keepalive=True,
+        retries={'mode': 'standard', 'max_attempts': 5}
+    )
+
+@functools.lru_cache(maxsize=1)
+def _get_session():
+    """Build the shared boto3 Session on first use.
+
+    One session shared by all clients, so credential resolution and botocore's
+    endpoint/service data loading happen once per process.
+    """
+    import boto3
+    return boto3.Session(**Config._AWS_KWARGS)
+
+@functools.lru_cache(maxsize=None)
+def _build_client(service_name: str, region_name: str):
+    """Create (or return the cached) boto3 client for a service/region pair.
+
+    Credential validation lives here, on the cache-miss path, so cached
+    lookups return without re-checking anything.
+    """
+    if not Config.validate_aws_credentials():
+        raise ValueError(
+            "AWS credentials are not properly configured. "
+            "Please set AWS_ACCESS_KEY_ID, AWS_SECRET_ACCESS_KEY, and AWS_DEFAULT_REGION "
+            "in your .env file."
+        )
+
+    from botocore.exceptions import NoCredentialsError
+    try:
+        client = _get_session().client(
+            service_name,
+            region_name=region_name,
+            config=_get_boto_config()
+        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"Created AWS {service_name} client for region {region_name}")
+        return client
+    except NoCredentialsError:
+        logger.error("AWS credentials are invalid or not found")
+        raise
+    except Exception as e:
+        logger.error(f"Failed to create AWS {service_name} client: {str(e)}")
+        raise
 
 class AWSClientManager:
     """Manages AWS client creation with secure credential handling."""
-    
-    def __init__(self):
-        """Initialize the AWS client manager."""
-        self._clients = {}
-    
+
     def get_client(self, service_name: str, region_name: str = None):
         """
         Get an AWS client for the specified service.
-        
+
         Args:
             service_name (str): The AWS service name (e.g., 's3', 'ec2', 'secretsmanager')
             region_name (str, optional): The AWS region. Defaults to configured region.
-        
+
         Returns:
             boto3.client: The AWS client instance
-            
+
         Raises:
             ValueError: If AWS credentials are not properly configured
             NoCredentialsError: If AWS credentials are invalid
         """
-        if not Config.validate_aws_credentials():
-            raise ValueError(
-                "AWS credentials are not properly configured. "
-                "Please set AWS_ACCESS_KEY_ID, AWS_SECRET_ACCESS_KEY, and AWS_DEFAULT_REGION "
-                "in your .env file."
-            )
-        
-        region = region_name or Config.AWS_DEFAULT_REGION
-        client_key = f"{service_name}_{region}"
-        
-        if client_key not in self._clients:
-            try:
-                self._clients[client_key] = boto3.client(
-                    service_name,
-                    aws_access_key_id=Config.AWS_ACCESS_KEY_ID,
-                    aws_secret_access_key=Config.AWS_SECRET_ACCESS_KEY,
-                    region_name=region
-                )
-                logger.info(f"Created AWS {service_name} client for region {region}")
-            except NoCredentialsError:
-                logger.error("AWS credentials are invalid or not found")
-                raise
-            except Exception as e:
-                logger.error(f"Failed to create AWS {service_name} client: {str(e)}")
-                raise
-        
-        return self._clients[client_key]
-    
+        return _build_client(service_name, region_name or Config.AWS_DEFAULT_REGION)
+
     def test_connection(self) -> bool:
         """
         Test the AWS connection by calling get_caller_identity.
-        
+
         Returns:
             bool: True if connection is successful, False otherwise
         """
@@ -79,26 +109,66 @@ class AWSClientManager:
             logger.error(f"Failed to connect to AWS: {str(e)}")
             return False
 
-# Global instance
-aws_client_manager = AWSClientManager()
+# Services the application is known to use; warmed ahead of time on request.
+_WARM_SERVICES = ('sts', 's3', 'ec2', 'secretsmanager', 'cloudformation')
+
+def warm_clients(services=_WARM_SERVICES):
+    """Pre-build clients for the known services in a background thread.
+
+    Client creation is dominated by loading botocore's service data JSON from
+    disk; doing it in a daemon thread overlaps that I/O with whatever the
+    caller does next (e.g. importing the Flask app), so the first real AWS
+    call finds a warm cache.
+
+    Returns:
+        threading.Thread: The started warm-up thread, or None when credentials
+        are not configured.
+    """
+    if not Config.validate_aws_credentials():
+        return None
+
+    def _warm():
+        for service in services:
+            try:
+                _build_client(service, Config.AWS_DEFAULT_REGION)
+            except Exception as e:
+                logger.debug(f"Warm-up of {service} client failed: {str(e)}")
+
+    thread = threading.Thread(target=_warm, name='aws-client-warmup', daemon=True)
+    thread.start()
+    return thread
+
+# Lazily-created singleton, so scripts that only import this module don't pay
+# for a manager (or boto3) they never use.
+_manager = None
+_manager_lock = threading.Lock()
+
+def get_manager() -> AWSClientManager:
+    """Get the shared AWSClientManager, creating it on first use."""
+    global _manager
+    if _manager is None:
+        with _manager_lock:
+            if _manager is None:
+                _manager = AWSClientManager()
+    return _manager
 
 # Convenience functions
 def get_s3_client(region_name: str = None):
     """Get an S3 client."""
-    return aws_client_manager.get_client('s3', region_name)
+    return get_manager().get_client('s3', region_name)
 
 def get_ec2_client(region_name: str = None):
     """Get an EC2 client."""
-    return aws_client_manager.get_client('ec2', region_name)
+    return get_manager().get_client('ec2', region_name)
 
 def get_secrets_manager_client(region_name: str = None):
     """Get a Secrets Manager client."""
-    return aws_client_manager.get_client('secretsmanager', region_name)
+    return get_manager().get_client('secretsmanager', region_name)
 
 def get_cloudformation_client(region_name: str = None):
     """Get a CloudFormation client."""
-    return aws_client_manager.get_client('cloudformation', region_name)
+    return get_manager().get_client('cloudformation', region_name)
 
 def test_aws_connection() -> bool:
     """Test AWS connection."""
-    return aws_client_manager.test_connection()
+    return get_manager().test_connection()
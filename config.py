@@ -10,43 +10,64 @@ from typing import Optional
 # Load environment variables from .env file
 load_dotenv()
 
+# Environment values are immutable after load_dotenv(), so read them once into
+# module-level constants; Config below just binds to them.
+AWS_ACCESS_KEY_ID: Optional[str] = os.getenv('AWS_ACCESS_KEY_ID')
+AWS_SECRET_ACCESS_KEY: Optional[str] = os.getenv('AWS_SECRET_ACCESS_KEY')
+AWS_DEFAULT_REGION: str = os.getenv('AWS_DEFAULT_REGION', 'us-east-1')
+AWS_ACCOUNT_ID: Optional[str] = os.getenv('AWS_ACCOUNT_ID')
+
+FLASK_ENV: str = os.getenv('FLASK_ENV', 'development')
+FLASK_DEBUG: bool = os.getenv('FLASK_DEBUG', 'True').lower() == 'true'
+SECRET_KEY: str = os.getenv('SECRET_KEY', 'dev-secret-key-change-in-production')
+
+DATABASE_URL: Optional[str] = os.getenv('DATABASE_URL')
+
 class Config:
     """Application configuration class."""
-    
+
     # AWS Configuration
-    AWS_ACCESS_KEY_ID: Optional[str] = os.getenv('AWS_ACCESS_KEY_ID')
-    AWS_SECRET_ACCESS_KEY: Optional[str] = os.getenv('AWS_SECRET_ACCESS_KEY')
-    AWS_DEFAULT_REGION: str = os.getenv('AWS_DEFAULT_REGION', 'us-east-1')
-    AWS_ACCOUNT_ID: Optional[str] = os.getenv('AWS_ACCOUNT_ID')
-    
+    AWS_ACCESS_KEY_ID = AWS_ACCESS_KEY_ID
+    AWS_SECRET_ACCESS_KEY = AWS_SECRET_ACCESS_KEY
+    AWS_DEFAULT_REGION = AWS_DEFAULT_REGION
+    AWS_ACCOUNT_ID = AWS_ACCOUNT_ID
+
     # Flask Configuration
-    FLASK_ENV: str = os.getenv('FLASK_ENV', 'development')
-    FLASK_DEBUG: bool = os.getenv('FLASK_DEBUG', 'True').lower() == 'true'
-    SECRET_KEY: str = os.getenv('SECRET_KEY', 'dev-secret-key-change-in-production')
-    
+    FLASK_ENV = FLASK_ENV
+    FLASK_DEBUG = FLASK_DEBUG
+    SECRET_KEY = SECRET_KEY
+
     # Database Configuration
-    DATABASE_URL: Optional[str] = os.getenv('DATABASE_URL')
-    
+    DATABASE_URL = DATABASE_URL
+
+    # Credentials are loaded once by load_dotenv() above, so validate them once
+    # at class creation instead of re-checking on every call.
+    _CREDS_VALID: bool = all([
+        AWS_ACCESS_KEY_ID,
+        AWS_SECRET_ACCESS_KEY,
+        AWS_DEFAULT_REGION
+    ])
+
+    # Precomputed boto3 keyword arguments, built once so callers don't rebuild
+    # the same dict on every client construction.
+    _AWS_KWARGS: dict = {
+        'aws_access_key_id': AWS_ACCESS_KEY_ID,
+        'aws_secret_access_key': AWS_SECRET_ACCESS_KEY,
+        'region_name': AWS_DEFAULT_REGION
+    }
+
     @classmethod
     def validate_aws_credentials(cls) -> bool:
         """Validate that AWS credentials are properly configured."""
-        return all([
-            cls.AWS_ACCESS_KEY_ID,
-            cls.AWS_SECRET_ACCESS_KEY,
-            cls.AWS_DEFAULT_REGION
-        ])
-    
+        return cls._CREDS_VALID
+
     @classmethod
     def get_aws_credentials(cls) -> dict:
         """Get AWS credentials as a dictionary."""
         if not cls.validate_aws_credentials():
             raise ValueError("AWS credentials are not properly configured. Please check your .env file.")
-        
-        return {
-            'aws_access_key_id': cls.AWS_ACCESS_KEY_ID,
-            'aws_secret_access_key': cls.AWS_SECRET_ACCESS_KEY,
-            'region_name': cls.AWS_DEFAULT_REGION
-        }
+
+        return cls._AWS_KWARGS
 
 # Development configuration
 class DevelopmentConfig(Config):
@@ -4,22 +4,17 @@ AWS CLI Configuration Script
 This script helps you configure AWS CLI with your credentials securely.
 """
 
+import configparser
 import os
-import subprocess
 import sys
 from pathlib import Path
 
-def run_command(command, check=True):
-    """Run a shell command and return the result."""
-    try:
-        result = subprocess.run(command, shell=True, capture_output=True, text=True, check=check)
-        return result.returncode == 0, result.stdout, result.stderr
-    except subprocess.CalledProcessError as e:
-        return False, e.stdout, e.stderr
+from env_utils import apply_env
+from setup_common import run_command
 
 def check_aws_cli_installed():
     """Check if AWS CLI is installed."""
-    success, stdout, stderr = run_command("aws --version", check=False)
+    success, stdout, stderr = run_command(['aws', '--version'], check=False)
     if success:
         print(f"✅ AWS CLI is installed: {stdout.strip()}")
         return True
@@ -28,35 +23,67 @@ def check_aws_cli_installed():
         print("📋 Please install AWS CLI from: https://aws.amazon.com/cli/")
         return False
 
+def _open_private(path, flags):
+    """open() opener that creates files readable only by the owner (0600)."""
+    return os.open(path, flags, 0o600)
+
+def _write_ini_section(path, section, values):
+    """Update one section of an INI file, keeping owner-only permissions.
+
+    Like `aws configure set`, the file is created with mode 0600 (and its
+    directory 0700). Unlike the AWS CLI's writer, configparser's
+    read-then-rewrite cycle does not preserve comments; other sections and
+    keys are kept.
+    """
+    parser = configparser.ConfigParser()
+    parser.read(path)
+    if not parser.has_section(section):
+        parser.add_section(section)
+    for key, value in values.items():
+        parser.set(section, key, value)
+    with open(path, 'w', opener=_open_private) as f:
+        parser.write(f)
+    # Existing files keep their old mode, so enforce 0600 explicitly
+    os.chmod(path, 0o600)
+
+def write_aws_cli_config(access_key, secret_key, region):
+    """Write the AWS CLI credentials and config files directly.
+
+    This is what `aws configure set` does, without spawning a subprocess
+    (and loading botocore) for every single key.
+    """
+    aws_dir = Path.home() / '.aws'
+    aws_dir.mkdir(mode=0o700, exist_ok=True)
+
+    _write_ini_section(aws_dir / 'credentials', 'default', {
+        'aws_access_key_id': access_key,
+        'aws_secret_access_key': secret_key,
+    })
+    _write_ini_section(aws_dir / 'config', 'default', {
+        'region': region,
+        'output': 'json',
+    })
+
 def configure_aws_cli():
     """Configure AWS CLI with credentials from environment variables."""
     # Check if environment variables are set
     access_key = os.getenv('AWS_ACCESS_KEY_ID')
     secret_key = os.getenv('AWS_SECRET_ACCESS_KEY')
     region = os.getenv('AWS_DEFAULT_REGION', 'us-east-1')
-    
+
     if not access_key or not secret_key:
         print("❌ AWS credentials not found in environment variables")
         print("📋 Please set AWS_ACCESS_KEY_ID and AWS_SECRET_ACCESS_KEY in your .env file")
         return False
-    
+
     print("🔧 Configuring AWS CLI...")
-    
-    # Configure AWS CLI
-    commands = [
-        f'aws configure set aws_access_key_id "{access_key}"',
-        f'aws configure set aws_secret_access_key "{secret_key}"',
-        f'aws configure set default.region "{region}"',
-        'aws configure set default.output "json"'
-    ]
-    
-    for command in commands:
-        success, stdout, stderr = run_command(command, check=False)
-        if not success:
-            print(f"❌ Failed to run: {command}")
-            print(f"Error: {stderr}")
-            return False
-    
+
+    try:
+        write_aws_cli_config(access_key, secret_key, region)
+    except OSError as e:
+        print(f"❌ Failed to write AWS CLI configuration: {e}")
+        return False
+
     print("✅ AWS CLI configured successfully")
     return True
 
@@ -64,7 +91,7 @@ def test_aws_connection():
     """Test AWS connection using AWS CLI."""
     print("🧪 Testing AWS connection...")
     
-    success, stdout, stderr = run_command("aws sts get-caller-identity", check=False)
+    success, stdout, stderr = run_command(['aws', 'sts', 'get-caller-identity'], check=False)
     if success:
         print("✅ AWS connection successful!")
         print(f"Response: {stdout.strip()}")
@@ -89,12 +116,8 @@ def main():
     env_file = Path('.env')
     if env_file.exists():
         print("✅ Found .env file")
-        # Load environment variables
-        with open(env_file, 'r') as f:
-            for line in f:
-                if line.strip() and not line.startswith('#') and '=' in line:
-                    key, value = line.strip().split('=', 1)
-                    os.environ[key] = value
+        # Load environment variables (parsed once and cached)
+        apply_env()
         print("✅ Environment variables loaded")
     else:
         print("❌ .env file not found")
@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+"""
+Cached .env loading helpers shared by the setup scripts.
+Parses the .env file once per process instead of re-reading it in every script.
+"""
+
+import functools
+import os
+import re
+
+from dotenv import dotenv_values
+
+# Matches lines like AWS_ACCESS_KEY_ID=your_access_key_here
+_PLACEHOLDER_RE = re.compile(r'^(\w+)=your_', re.MULTILINE)
+
+@functools.lru_cache(maxsize=1)
+def load_env_cached(env_file: str = '.env') -> dict:
+    """Parse the .env file once and cache the resulting mapping."""
+    return dotenv_values(env_file)
+
+def apply_env(env_file: str = '.env') -> None:
+    """Load the cached .env values into os.environ."""
+    os.environ.update(
+        {key: value for key, value in load_env_cached(env_file).items() if value is not None}
+    )
+
+def find_placeholder_vars(content: str) -> set:
+    """Find variables in .env content still set to their 'your_...' placeholders."""
+    return set(_PLACEHOLDER_RE.findall(content))
@@ -7,14 +7,16 @@ This script loads environment variables and starts the Flask application securel
 import os
 import sys
 from pathlib import Path
-from dotenv import load_dotenv
+
+import _aws_lazy
 
 def load_environment():
     """Load environment variables from .env file."""
     env_file = Path('.env')
-    
+
     if env_file.exists():
-        load_dotenv()
+        # Importing config runs load_dotenv() once for the whole process.
+        import config  # noqa: F401
         print("✅ Environment variables loaded from .env file")
         return True
     else:
@@ -24,17 +26,16 @@ def load_environment():
 
 def validate_environment():
     """Validate that required environment variables are set."""
-    required_vars = [
+    required_vars = {
         'AWS_ACCESS_KEY_ID',
         'AWS_SECRET_ACCESS_KEY',
         'AWS_DEFAULT_REGION'
-    ]
-    
-    missing_vars = []
-    for var in required_vars:
-        if not os.getenv(var):
-            missing_vars.append(var)
-    
+    }
+
+    # Single pass over the required set; set-but-empty values (e.g. a bare
+    # 'AWS_ACCESS_KEY_ID=' line in .env) count as missing too.
+    missing_vars = sorted(var for var in required_vars if not os.environ.get(var))
+
     if missing_vars:
         print(f"❌ Missing required environment variables: {', '.join(missing_vars)}")
         return False
@@ -45,8 +46,7 @@ def validate_environment():
 def test_aws_connection():
     """Test AWS connection before starting the application."""
     try:
-        from aws_client import test_aws_connection
-        if test_aws_connection():
+        if _aws_lazy.test_aws_connection():
             print("✅ AWS connection successful")
             return True
         else:
@@ -80,6 +80,9 @@ def main():
     # Step 4: Start the application
     print("\n4. Starting Flask application...")
     try:
+        # Warm the AWS clients in the background while Flask imports
+        _aws_lazy.warm_clients()
+
         # Import and run the app
         sys.path.append('Backend')
         from app import app
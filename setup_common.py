@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Shared helpers for the environment setup scripts.
+Keeps create/validate/test logic in one place so each script doesn't carry
+its own copy (and its own import costs).
+"""
+
+import shutil
+import subprocess
+from pathlib import Path
+
+import _aws_lazy
+from env_utils import find_placeholder_vars
+
+def run_command(argv, check=True, capture=True):
+    """Run a command (given as an argv list) and return the result.
+
+    Pass capture=False when the caller only cares about success: output goes
+    to /dev/null, skipping the pipe setup and decoding entirely.
+    """
+    try:
+        if capture:
+            result = subprocess.run(argv, capture_output=True, text=True, check=check)
+            return result.returncode == 0, result.stdout, result.stderr
+        result = subprocess.run(
+            argv, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=check
+        )
+        return result.returncode == 0, '', ''
+    except subprocess.CalledProcessError as e:
+        return False, e.stdout or '', e.stderr or ''
+    except FileNotFoundError as e:
+        return False, '', str(e)
+
+def create_env_file():
+    """Create .env file from .env.example if it doesn't exist."""
+    env_file = Path('.env')
+    env_example = Path('.env.example')
+
+    if env_file.exists():
+        print("✅ .env file already exists")
+        return True
+
+    if not env_example.exists():
+        print("❌ .env.example file not found")
+        return False
+
+    # Copy .env.example to .env (kernel-level copy, no Python-side buffering)
+    shutil.copyfile(env_example, env_file)
+
+    print("✅ Created .env file from .env.example")
+    print("📝 Please edit .env file with your actual credentials")
+    return True
+
+def validate_env_file():
+    """Validate that .env file has required variables."""
+    env_file = Path('.env')
+
+    if not env_file.exists():
+        print("❌ .env file not found")
+        return False
+
+    required_vars = {
+        'AWS_ACCESS_KEY_ID',
+        'AWS_SECRET_ACCESS_KEY',
+        'AWS_DEFAULT_REGION'
+    }
+
+    with open(env_file, 'r') as f:
+        content = f.read()
+
+    # One regex pass over the file instead of a substring scan per variable
+    missing_vars = sorted(required_vars & find_placeholder_vars(content))
+
+    if missing_vars:
+        print(f"❌ Please update these variables in .env file: {', '.join(missing_vars)}")
+        return False
+
+    print("✅ .env file appears to be configured")
+    return True
+
+def test_aws_connection():
+    """Test AWS connection using the configured credentials."""
+    try:
+        # Resolved lazily so non-AWS setup steps never pay the boto3 import
+        if _aws_lazy.test_aws_connection():
+            print("✅ AWS connection successful")
+            return True
+        else:
+            print("❌ AWS connection failed")
+            return False
+    except ImportError:
+        print("❌ Could not import aws_client module")
+        return False
+    except Exception as e:
+        print(f"❌ AWS connection test failed: {str(e)}")
+        return False
@@ -4,11 +4,14 @@ Complete Secure Environment Setup Script
 This script sets up the entire secure environment for the Hotel Booking Cancellation Prediction application.
 """
 
+import concurrent.futures
 import os
 import sys
-import subprocess
 from pathlib import Path
 
+from env_utils import apply_env
+from setup_common import create_env_file, validate_env_file, test_aws_connection, run_command
+
 def print_header(title):
     """Print a formatted header."""
     print(f"\n{'='*60}")
@@ -19,14 +22,6 @@ def print_step(step_num, description):
     """Print a formatted step."""
     print(f"\n{step_num}. {description}")
 
-def run_command(command, check=True):
-    """Run a shell command and return the result."""
-    try:
-        result = subprocess.run(command, shell=True, capture_output=True, text=True, check=check)
-        return result.returncode == 0, result.stdout, result.stderr
-    except subprocess.CalledProcessError as e:
-        return False, e.stdout, e.stderr
-
 def check_python_version():
     """Check if Python version is compatible."""
     version = sys.version_info
@@ -41,7 +36,9 @@ def check_python_version():
 def install_dependencies():
     """Install Python dependencies."""
     print("📦 Installing Python dependencies...")
-    success, stdout, stderr = run_command("pip install -r requirements.txt", check=False)
+    success, stdout, stderr = run_command(
+        [sys.executable, '-m', 'pip', 'install', '-r', 'requirements.txt'], check=False
+    )
     if success:
         print("✅ Dependencies installed successfully")
         return True
@@ -50,112 +47,35 @@ def install_dependencies():
         print(f"Error: {stderr}")
         return False
 
-def create_env_file():
-    """Create .env file from .env.example if it doesn't exist."""
-    env_file = Path('.env')
-    env_example = Path('.env.example')
-    
-    if env_file.exists():
-        print("✅ .env file already exists")
-        return True
-    
-    if not env_example.exists():
-        print("❌ .env.example file not found")
-        return False
-    
-    # Copy .env.example to .env
-    with open(env_example, 'r') as src, open(env_file, 'w') as dst:
-        dst.write(src.read())
-    
-    print("✅ Created .env file from .env.example")
-    print("📝 Please edit .env file with your actual credentials")
-    return True
-
-def validate_env_file():
-    """Validate that .env file has required variables."""
-    env_file = Path('.env')
-    
-    if not env_file.exists():
-        print("❌ .env file not found")
-        return False
-    
-    required_vars = [
-        'AWS_ACCESS_KEY_ID',
-        'AWS_SECRET_ACCESS_KEY',
-        'AWS_DEFAULT_REGION'
-    ]
-    
-    missing_vars = []
-    
-    with open(env_file, 'r') as f:
-        content = f.read()
-        for var in required_vars:
-            if f"{var}=your_" in content:
-                missing_vars.append(var)
-    
-    if missing_vars:
-        print(f"❌ Please update these variables in .env file: {', '.join(missing_vars)}")
-        return False
-    
-    print("✅ .env file appears to be configured")
-    return True
-
-def test_aws_connection():
-    """Test AWS connection using the configured credentials."""
-    try:
-        from aws_client import test_aws_connection
-        if test_aws_connection():
-            print("✅ AWS connection successful")
-            return True
-        else:
-            print("❌ AWS connection failed")
-            return False
-    except ImportError:
-        print("❌ Could not import aws_client module")
-        return False
-    except Exception as e:
-        print(f"❌ AWS connection test failed: {str(e)}")
-        return False
-
 def configure_aws_cli():
     """Configure AWS CLI with credentials from environment variables."""
     # Check if AWS CLI is installed
-    success, stdout, stderr = run_command("aws --version", check=False)
+    success, stdout, stderr = run_command(['aws', '--version'], check=False, capture=False)
     if not success:
         print("⚠️  AWS CLI is not installed")
         print("📋 You can install it from: https://aws.amazon.com/cli/")
         return True  # Not critical for the application to work
     
     print("🔧 Configuring AWS CLI...")
-    
-    # Load environment variables
+
+    # Load environment variables (parsed once and cached)
     env_file = Path('.env')
     if env_file.exists():
-        with open(env_file, 'r') as f:
-            for line in f:
-                if line.strip() and not line.startswith('#') and '=' in line:
-                    key, value = line.strip().split('=', 1)
-                    os.environ[key] = value
-    
+        apply_env()
+
     # Configure AWS CLI
     access_key = os.getenv('AWS_ACCESS_KEY_ID')
     secret_key = os.getenv('AWS_SECRET_ACCESS_KEY')
     region = os.getenv('AWS_DEFAULT_REGION', 'us-east-1')
-    
+
     if access_key and secret_key:
-        commands = [
-            f'aws configure set aws_access_key_id "{access_key}"',
-            f'aws configure set aws_secret_access_key "{secret_key}"',
-            f'aws configure set default.region "{region}"',
-            'aws configure set default.output "json"'
-        ]
-        
-        for command in commands:
-            success, stdout, stderr = run_command(command, check=False)
-            if not success:
-                print(f"❌ Failed to configure AWS CLI: {command}")
-                return False
-        
+        from configure_aws_cli import write_aws_cli_config
+        try:
+            write_aws_cli_config(access_key, secret_key, region)
+        except OSError as e:
+            print(f"❌ Failed to write AWS CLI configuration: {e}")
+            return False
+
         print("✅ AWS CLI configured successfully")
         return True
     else:
@@ -174,16 +94,16 @@ def main():
     if not check_python_version():
         sys.exit(1)
     
-    # Step 2: Install dependencies
+    # Steps 2 and 3 are independent, and the pip install dominates the
+    # runtime, so run the .env setup while pip is working.
     print_step("2", "Installing dependencies")
-    if not install_dependencies():
-        sys.exit(1)
-    
-    # Step 3: Create .env file
     print_step("3", "Setting up environment variables")
-    if not create_env_file():
-        sys.exit(1)
-    
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        install_future = executor.submit(install_dependencies)
+        env_future = executor.submit(create_env_file)
+        if not install_future.result() or not env_future.result():
+            sys.exit(1)
+
     # Step 4: Validate .env file
     print_step("4", "Validating environment configuration")
     if not validate_env_file():
@@ -0,0 +1,90 @@
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+
+# Add the repo root to the path so we can import the app; doing this (and the
+# heavy Backend.app import chain) once here instead of per test file.
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import Backend.app as backend_app
+from Backend.app import app
+
+def _default_predict_logic(payload):
+    """Default mock behavior handling both single and batch predictions."""
+    if isinstance(payload, list) and len(payload) > 1: # Batch prediction
+        return {
+            'predictions': [1, 0],
+            'probabilities': [0.91, 0.15]
+        }
+    else: # Single prediction
+        return {
+            'predictions': [1],
+            'probabilities': [0.91]
+        }
+
+class _StubPredict:
+    """Callable predict attribute keeping Mock's side_effect contract."""
+
+    def __init__(self, side_effect):
+        self.side_effect = side_effect
+
+    def __call__(self, payload):
+        effect = self.side_effect
+        if isinstance(effect, BaseException) or (
+            isinstance(effect, type) and issubclass(effect, BaseException)
+        ):
+            raise effect
+        return effect(payload)
+
+class _StubPredictor:
+    """Minimal stand-in for the SageMaker predictor.
+
+    A plain object with a predict callable — none of MagicMock's per-call
+    bookkeeping, which these tests never assert on.
+    """
+
+    def __init__(self, side_effect):
+        self.predict = _StubPredict(side_effect)
+
+# The shared instance installed by the module-scoped patch below.
+_shared_predictor = _StubPredictor(_default_predict_logic)
+
+@pytest.fixture(scope="session")
+def batch_csv_bytes():
+    """Serialize the batch-upload test CSV once for the whole session.
+
+    pandas is imported here, not at module top, so only batch tests pull
+    it in.
+    """
+    import pandas as pd
+    test_df = pd.DataFrame({
+        'hotel': ['Resort Hotel', 'City Hotel'],
+        'arrival_date_month': [7, 8],
+        'lead_time': [30, 10],
+        'adr': [100.0, 120.0],
+        'total_of_special_requests': [1, 0]
+    })
+    return test_df.to_csv(index=False).encode()
+
+@pytest.fixture(scope="session")
+def client():
+    """Create one test client for the Flask application, shared by the session."""
+    app.config['TESTING'] = True
+    # The secret key needs to be set for flash messages to work in tests
+    app.config['SECRET_KEY'] = 'test_secret_key_for_ci'
+    with app.test_client() as client:
+        yield client
+
+@pytest.fixture(scope="module", autouse=True)
+def _patch_predictor():
+    """Patch the SageMaker predictor once per module instead of per test."""
+    with patch.object(backend_app, 'predictor', _shared_predictor):
+        yield
+
+@pytest.fixture
+def mock_predictor():
+    """Stub the SageMaker predictor to isolate tests from the live endpoint."""
+    _shared_predictor.predict.side_effect = _default_predict_logic
+    yield _shared_predictor
@@ -1,43 +1,34 @@
 import pytest
 import json
-import os
-import sys
 import io
-import pandas as pd
-from unittest.mock import patch, MagicMock
-
-# Add the Backend directory to the path so we can import the app
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from unittest.mock import patch
+from werkzeug.datastructures import FileStorage, MultiDict
 
+# conftest.py has already set up sys.path and imported the app module,
+# so this resolves from the module cache.
+import Backend.app as backend_app
 from Backend.app import app
 
-@pytest.fixture
-def client():
-    """Create a test client for the Flask application."""
-    app.config['TESTING'] = True
-    # The secret key needs to be set for flash messages to work in tests
-    app.config['SECRET_KEY'] = 'test_secret_key_for_ci'
-    with app.test_client() as client:
-        yield client
-
-@pytest.fixture
-def mock_predictor():
-    """Mock the SageMaker predictor to isolate tests from the live endpoint."""
-    with patch('Backend.app.predictor') as mock_pred:
-        # A mock that handles both single and batch predictions
-        def mock_predict_logic(payload):
-            if isinstance(payload, list) and len(payload) > 1: # Batch prediction
-                return {
-                    'predictions': [1, 0],
-                    'probabilities': [0.91, 0.15]
-                }
-            else: # Single prediction
-                return {
-                    'predictions': [1],
-                    'probabilities': [0.91]
-                }
-        mock_pred.predict.side_effect = mock_predict_logic
-        yield mock_pred
+# Shared by every /predict parametrization; the test client serializes it
+# and sets the JSON content type in one step via the json= kwarg.
+_PREDICT_JSON = {'hotel': 'Resort Hotel', 'lead_time': 30, 'adr': 100.0}
+
+# Expected response text as bytes constants, checked against a single
+# materialization of the response body.
+_HOME_EXPECTED = (b'Predict Cancellation',)
+_BATCH_EXPECTED = (b'Predicted Cancellation',)
+
+def _post_batch_file(filename, payload, content_type='text/csv'):
+    """POST a file to /batch with a pre-built FileStorage.
+
+    Injecting the file into the request context directly skips Werkzeug's
+    multipart encode/parse round-trip, which is the slow part of these tests.
+    """
+    from flask import request
+    fs = FileStorage(stream=io.BytesIO(payload), filename=filename, content_type=content_type)
+    with app.test_request_context('/batch', method='POST'):
+        request.files = MultiDict({'file': fs})
+        return app.full_dispatch_request()
 
 class TestApp:
     """Test cases for the Flask application."""
@@ -47,7 +38,8 @@ class TestApp:
         response = client.get('/')
         assert response.status_code == 200
         # --- FIX: Check for text that actually exists on the homepage ---
-        assert b'Predict Cancellation' in response.data
+        body = response.data
+        assert all(text in body for text in _HOME_EXPECTED)
 
     def test_visualizations_route(self, client):
         """Test the visualizations route."""
@@ -59,64 +51,50 @@ class TestApp:
         response = client.get('/batch')
         assert response.status_code == 200
 
-    def test_predict_route_success(self, client, mock_predictor):
-        """Test successful single prediction."""
-        test_data = {'hotel': 'Resort Hotel', 'lead_time': 30, 'adr': 100.0}
-        response = client.post('/predict', data=json.dumps(test_data), content_type='application/json')
-        assert response.status_code == 200
-        data = json.loads(response.data)
-        assert data['prediction_text'] == 'Booking will be Cancelled'
-        assert data['probability'] == '91.00%'
-
-    def test_predict_route_no_predictor(self, client):
-        """Test prediction route when the predictor is not configured."""
-        with patch('Backend.app.predictor', None):
-            test_data = {'hotel': 'Resort Hotel'}
-            response = client.post('/predict', data=json.dumps(test_data), content_type='application/json')
-            assert response.status_code == 500
-            data = json.loads(response.data)
-            assert 'endpoint is not configured' in data['error']
-
-    def test_predict_route_model_error(self, client, mock_predictor):
-        """Test prediction when the model raises an exception."""
-        mock_predictor.predict.side_effect = Exception("Model inference error")
-        test_data = {'hotel': 'Resort Hotel'}
-        response = client.post('/predict', data=json.dumps(test_data), content_type='application/json')
-        assert response.status_code == 400
+    @pytest.mark.parametrize("predictor_state,expected_status,expected_text", [
+        ('ok', 200, 'Booking will be Cancelled'),
+        ('missing', 500, 'endpoint is not configured'),
+        ('error', 400, 'Model inference error'),
+    ])
+    def test_predict_route(self, client, mock_predictor, predictor_state,
+                           expected_status, expected_text):
+        """Test single prediction across predictor states (ok/missing/error)."""
+        if predictor_state == 'error':
+            mock_predictor.predict.side_effect = Exception("Model inference error")
+
+        if predictor_state == 'missing':
+            with patch.object(backend_app, 'predictor', None):
+                response = client.post('/predict', json=_PREDICT_JSON)
+        else:
+            response = client.post('/predict', json=_PREDICT_JSON)
+
+        assert response.status_code == expected_status
         data = json.loads(response.data)
-        assert 'Model inference error' in data['error']
+        if predictor_state == 'ok':
+            assert data['prediction_text'] == expected_text
+            assert data['probability'] == '91.00%'
+        else:
+            assert expected_text in data['error']
 
-    def test_batch_route_no_file(self, client):
-        """Test batch route with no file uploaded."""
-        response = client.post('/batch', data={})
-        assert response.status_code == 302 # Should redirect
-        
-    def test_batch_route_wrong_file_type(self, client):
-        """Test batch route with a non-CSV file."""
-        data = {'file': (io.BytesIO(b'this is not a csv'), 'test.txt')}
-        response = client.post('/batch', data=data, content_type='multipart/form-data')
+    @pytest.mark.parametrize("filename,payload", [
+        (None, None),                        # no file uploaded
+        ('test.txt', b'this is not a csv'),  # wrong file type
+    ])
+    def test_batch_route_rejects_bad_upload(self, client, filename, payload):
+        """Test batch route redirects when the upload is missing or not a CSV."""
+        if filename is None:
+            response = client.post('/batch', data={})
+        else:
+            response = _post_batch_file(filename, payload, content_type='text/plain')
         assert response.status_code == 302 # Should redirect
 
-    def test_batch_route_success(self, client, mock_predictor):
+    @pytest.mark.slow
+    def test_batch_route_success(self, client, mock_predictor, batch_csv_bytes):
         """Test successful batch prediction."""
-        test_df = pd.DataFrame({
-            'hotel': ['Resort Hotel', 'City Hotel'],
-            'arrival_date_month': [7, 8],
-            'lead_time': [30, 10],
-            'adr': [100.0, 120.0],
-            'total_of_special_requests': [1, 0]
-        })
-    
-        csv_buffer = io.StringIO()
-        test_df.to_csv(csv_buffer, index=False)
-        csv_buffer.seek(0)
-    
-        bytes_buffer = io.BytesIO(csv_buffer.getvalue().encode())
-    
-        data = {'file': (bytes_buffer, 'test.csv')}
-        response = client.post('/batch', data=data, content_type='multipart/form-data')
-    
+        response = _post_batch_file('test.csv', batch_csv_bytes)
+
         assert response.status_code == 200
         # --- FIX: Check for a column header from the results table ---
-        assert b'Predicted Cancellation' in response.data
+        body = response.data
+        assert all(text in body for text in _BATCH_EXPECTED)
 